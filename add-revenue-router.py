@@ -1,24 +1,50 @@
 #!/usr/bin/env python3
-import re
+import os
+import sys
 
-file_path = "backend/server.js"
-
-with open(file_path, 'r') as f:
-    content = f.read()
-
-# Add import after searchAdsRouter
-old_import = "import searchAdsRouter from \"./api/searchAds.js\";\nimport storageService"
-new_import = "import searchAdsRouter from \"./api/searchAds.js\";\nimport revenueRouter from \"./api/revenue.js\";\nimport storageService"
-
-content = content.replace(old_import, new_import)
+OK = "[ok]" if sys.platform == "win32" else "✅"
+FAIL = "[fail]" if sys.platform == "win32" else "❌"
 
-# Add route after searchAdsRouter
-old_route = "app.use(\"/api/searchAds\", searchAdsRouter);"
-new_route = "app.use(\"/api/searchAds\", searchAdsRouter);\napp.use(\"/api/revenue\", revenueRouter);"
-
-content = content.replace(old_route, new_route)
-
-with open(file_path, 'w') as f:
-    f.write(content)
+file_path = "backend/server.js"
 
-print("✅ Added revenue router to server.js")
+# Read through a bare fd - os.read with the size from one fstat skips the
+# buffered-IO setup of open()
+fd = os.open(file_path, os.O_RDONLY)
+size = os.fstat(fd).st_size
+content = os.read(fd, size)
+os.close(fd)
+
+# Splice at the first hit instead of replace(), which keeps scanning the
+# whole file after the match; bytes.index/find is a C-level memmem
+import_anchor = b"import searchAdsRouter from \"./api/searchAds.js\";\n"
+new_import = b"import revenueRouter from \"./api/revenue.js\";\n"
+
+route_anchor = b"app.use(\"/api/searchAds\", searchAdsRouter);"
+new_route = b"\napp.use(\"/api/revenue\", revenueRouter);"
+
+import_at = content.find(import_anchor)
+route_at = content.find(route_anchor)
+
+if b"revenueRouter" in content:
+    # server.js already has the import and route - rerunning must not
+    # duplicate them (duplicate import = SyntaxError at server start)
+    print(f"{OK} Revenue router already wired up")
+elif import_at == -1 or route_at == -1:
+    print(f"{FAIL} Anchors not found in server.js")
+else:
+    # Both insertions in one rebuild (import comes before the route)
+    import_at += len(import_anchor)
+    route_at += len(route_anchor)
+    content = b"".join((
+        content[:import_at],
+        new_import,
+        content[import_at:route_at],
+        new_route,
+        content[route_at:],
+    ))
+
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, file_path)
+    print(f"{OK} Added revenue router to server.js")
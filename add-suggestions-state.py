@@ -1,16 +1,45 @@
 #!/usr/bin/env python3
+import os
+import shutil
 import sys
 
-# Read the file
-with open('frontend/src/pages/StrategicDashboard.jsx', 'r') as f:
-    lines = f.readlines()
+FILE_PATH = 'frontend/src/pages/StrategicDashboard.jsx'
 
-# Find line 574 (0-indexed: 573) and insert after it
 insert_at = 574  # Line number to insert after (1-indexed)
-lines.insert(insert_at, '  const [suggestionsData, setSuggestionsData] = useState(null);\n')
+new_line = b'  const [suggestionsData, setSuggestionsData] = useState(null);\n'
 
-# Write back
-with open('frontend/src/pages/StrategicDashboard.jsx', 'w') as f:
-    f.writelines(lines)
+# Stream 64KB blocks into a temp file, counting newlines until the insertion
+# point; everything after the injected line is bulk-copied, so the file is
+# never held in memory or split into a per-line list
+tmp_path = FILE_PATH + '.tmp'
+with open(FILE_PATH, 'rb') as src, open(tmp_path, 'wb') as dst:
+    remaining = insert_at
+    inserted = False
+    while True:
+        chunk = src.read(1 << 16)
+        if not chunk:
+            break
+        newlines = chunk.count(b'\n')
+        if newlines < remaining:
+            dst.write(chunk)
+            remaining -= newlines
+            continue
+        # The insertion point is inside this chunk
+        idx = -1
+        for _ in range(remaining):
+            idx = chunk.index(b'\n', idx + 1)
+        dst.write(chunk[:idx + 1])
+        dst.write(new_line)
+        dst.write(chunk[idx + 1:])
+        inserted = True
+        break
+
+    if inserted:
+        shutil.copyfileobj(src, dst, length=1 << 20)
+    else:
+        # Fewer lines than insert_at - append at EOF, like list.insert did
+        dst.write(new_line)
+
+os.replace(tmp_path, FILE_PATH)
 
 print(f"Added suggestions state at line {insert_at + 1}")
@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
-import re
+import mmap
+import os
+import sys
 
-file_path = 'C:/Projects/blush-marketing/frontend/src/pages/ContentLibrary.jsx'
+OK = "[ok]" if sys.platform == "win32" else "✅"
+FAIL = "[fail]" if sys.platform == "win32" else "❌"
 
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+file_path = 'C:/Projects/blush-marketing/frontend/src/pages/ContentLibrary.jsx'
 
-# Find the position to insert
-marker = '  const handleVideoPreview = (post) => {'
+# Find the position to insert (marker and helpers are pure ASCII, so the
+# whole edit can stay on bytes)
+marker = b'  const handleVideoPreview = (post) => {'
 
-helper_code = '''
+helper_code = b'''
   // Helper function to format scheduled time with countdown
   const formatScheduledTime = (dateString) => {
     const date = new Date(dateString);
@@ -123,10 +126,20 @@ helper_code = '''
 
 '''
 
-if marker in content:
-    new_content = content.replace(marker, helper_code + marker)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    print('✅ Helper functions added successfully')
+# Scan through a read-only mmap so the source is never copied into the heap
+tmp_path = file_path + '.tmp'
+fd = os.open(file_path, os.O_RDONLY)
+with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+    idx = mm.find(marker)
+    if idx != -1:
+        with open(tmp_path, 'wb') as f:
+            f.write(mm[:idx])
+            f.write(helper_code)
+            f.write(mm[idx:])
+os.close(fd)
+
+if idx != -1:
+    os.replace(tmp_path, file_path)
+    print(f'{OK} Helper functions added successfully')
 else:
-    print('❌ Marker not found')
+    print(f'{FAIL} Marker not found')
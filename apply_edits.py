@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Run all of the one-shot editor scripts from a single interpreter.
+
+Each script is an independent text patch; invoking them one by one pays
+interpreter startup (~30ms) plus module imports per script. Running them
+in-process amortizes that cost across all six edits. A table of plain
+(find, replace) pairs cannot express these edits any more - several use
+brace scanning or a streamed mmap rewrite - so the driver executes the
+existing scripts as-is.
+
+The patches are not idempotent, so each entry carries an already-applied
+check against its target file and is skipped when its output is already
+in the tree.
+"""
+import runpy
+import sys
+
+# In the order the edits were originally applied:
+# (script, target file, predicate on the target's bytes that is true once
+# the script's edit is present)
+EDITS = [
+    ('rename-components.py',
+     'frontend/src/pages/StrategicDashboard.jsx',
+     lambda src: b'CompetitorKeywordCard' in src),
+    ('add-suggestions-state.py',
+     'frontend/src/pages/StrategicDashboard.jsx',
+     lambda src: b'const [suggestionsData, setSuggestionsData]' in src),
+    ('add-revenue-router.py',
+     'backend/server.js',
+     lambda src: b'revenueRouter' in src),
+    ('add_helpers.py',
+     'C:/Projects/blush-marketing/frontend/src/pages/ContentLibrary.jsx',
+     lambda src: b'const formatScheduledTime' in src),
+    ('fix-categories.py',
+     'run-mongodb-integration-tests.mjs',
+     lambda src: b"category: 'romance'" not in src
+     and b"category: 'drama'" not in src),
+    ('edit-chat.py',
+     'C:/Projects/blush-marketing/backend/api/chat.js',
+     lambda src: b'autoCreatedTodos' in src),
+]
+
+
+def main():
+    failed = 0
+    for script, target, applied in EDITS:
+        print(f"--- {script} ---")
+        try:
+            with open(target, 'rb') as f:
+                src = f.read()
+        except OSError as err:
+            print(f"{script}: cannot read {target}: {err}", file=sys.stderr)
+            failed += 1
+            continue
+        if applied(src):
+            print(f"already applied to {target}, skipping")
+            continue
+        try:
+            runpy.run_path(script, run_name='__main__')
+        except Exception as err:
+            # The edits are independent, so keep going and report at the end
+            print(f"{script} failed: {err}", file=sys.stderr)
+            failed += 1
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,35 +2,65 @@
 """
 Script to add auto-todo creation to chat.js
 """
-import re
+import os
+import sys
+
+OK = "[ok]" if sys.platform == "win32" else "✅"
+FAIL = "[fail]" if sys.platform == "win32" else "❌"
+
+file_path = 'C:/Projects/blush-marketing/backend/api/chat.js'
+
+
+def find_block(src, needle, start=0):
+    """Locate needle and the {...} block it opens.
+
+    Returns (needle_offset, block_end) where block_end is the offset just past
+    the brace matching the first '{' in needle, or (-1, -1) if the needle is
+    missing / the braces never balance. Linear scan, no regex backtracking.
+    """
+    at = src.find(needle, start)
+    if at == -1:
+        return -1, -1
+    depth = 0
+    for i in range(at + needle.index('{'), len(src)):
+        c = src[i]
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return at, i + 1
+    return at, -1
+
 
 # Read the file
-with open('C:/Projects/blush-marketing/backend/api/chat.js', 'r', encoding='utf-8') as f:
+with open(file_path, 'r', encoding='utf-8') as f:
     content = f.read()
 
 # Check if import already exists
 if 'createTodosFromAIRecommendations' in content:
-    print("✅ Import already exists")
+    print(f"{OK} Import already exists")
 else:
-    # Add import after line 2
-    lines = content.split('\n')
-    lines.insert(2, 'import { createTodosFromAIRecommendations } from "../utils/todoAutoCreator.js";')
-    content = '\n'.join(lines)
-    print("✅ Added import statement")
-
-# Find the section where we need to add auto-todo creation (after aiResponse is received)
-# Look for the pattern where we return the response
+    # Add import after line 2 - splice at the offset of the 2nd newline
+    # rather than splitting the whole file into lines and joining it back
+    i = -1
+    for _ in range(2):
+        i = content.index('\n', i + 1)
+    content = (content[:i + 1]
+               + 'import { createTodosFromAIRecommendations } from "../utils/todoAutoCreator.js";\n'
+               + content[i + 1:])
+    print(f"{OK} Added import statement")
+
+# Add the auto-todo creation before the final chat res.json and the
+# autoCreatedTodos fields inside it - both offsets come from the same
+# structural scan, then one rebuild splices both in
 if 'autoCreatedTodos' in content:
-    print("✅ Auto-todo code already exists")
+    print(f"{OK} Auto-todo code already exists")
 else:
-    # Find the location to add the auto-todo creation
-    # We'll add it right before the final res.json in the message endpoint
+    inserts = []
 
-    # Pattern: Find where we save the conversation and add auto-todo creation
-    pattern = r'(savedConversation = \{[^}]+\}\s*\}\s*)'
-
-    # Add auto-todo creation after saving conversation
-    replacement = r'''\1
+    # Auto-todo creation to insert after saving the conversation
+    todo_block = '''
     // Auto-create todos from AI recommendations
     let autoCreatedTodos = [];
     try {
@@ -45,38 +75,61 @@ else:
     }
 '''
 
-    content = re.sub(pattern, replacement, content, count=1)
-    print("✅ Added auto-todo creation code")
-
-    # Now modify the response to include autoCreatedTodos
-    # Find the res.json with the response
-    old_response = '''res.json({
-      success: true,
-      response: {
-        role: aiResponse.role,
-        content: aiResponse.content,
-        timestamp: aiResponse.timestamp,
-        proposal: aiResponse.proposal || null
-      },
-      conversationId: savedConversation?.id,'''
-
-    new_response = '''res.json({
-      success: true,
-      response: {
-        role: aiResponse.role,
-        content: aiResponse.content,
-        timestamp: aiResponse.timestamp,
-        proposal: aiResponse.proposal || null
-      },
-      conversationId: savedConversation?.id,
-      autoCreatedTodos: autoCreatedTodos,
-      autoCreatedTodosCount: autoCreatedTodos.length,'''
-
-    content = content.replace(old_response, new_response)
-    print("✅ Modified response to include autoCreatedTodos")
-
-# Write the file back
-with open('C:/Projects/blush-marketing/backend/api/chat.js', 'w', encoding='utf-8') as f:
+    # Locate the final chat response: the res.json({...}) block that returns
+    # success plus the AI response payload. Every savedConversation
+    # assignment sits inside a branch of the save logic, so anchoring there
+    # would block-scope let autoCreatedTodos away from this res.json.
+    search = 0
+    while True:
+        blk_start, blk_end = find_block(content, 'res.json({', search)
+        if blk_start == -1 or blk_end == -1:
+            blk_start = -1
+            print(f"{FAIL} Chat response res.json block not found")
+            break
+        block = content[blk_start:blk_end]
+        if 'success: true' in block and 'role: aiResponse.role' in block:
+            break
+        search = blk_start + 1
+
+    if blk_start != -1:
+        # The todo creation runs right before the response is sent, in the
+        # handler scope the res.json below reads autoCreatedTodos from
+        line_start = content.rfind('\n', 0, blk_start) + 1
+        inserts.append((line_start, todo_block))
+        print(f"{OK} Added auto-todo creation code")
+
+        # Extend the chat response with the new fields, placed after whatever
+        # conversationId field the response actually carries
+        new_fields = ('\n      autoCreatedTodos: autoCreatedTodos,'
+                      '\n      autoCreatedTodosCount: autoCreatedTodos.length,')
+
+        key_at = block.find('conversationId:')
+        if key_at != -1:
+            line_end = content.index('\n', blk_start + key_at)
+            inserts.append((line_end, new_fields))
+            print(f"{OK} Modified response to include autoCreatedTodos")
+        else:
+            print(f"{FAIL} conversationId field not found in chat response")
+
+    if len(inserts) != 2:
+        # Never write a half-applied edit
+        print(f"{FAIL} Anchors missing - leaving chat.js untouched")
+        sys.exit(1)
+
+    # Apply every insertion in a single rebuild of the file
+    pieces = []
+    last = 0
+    for at, text in sorted(inserts):
+        pieces.append(content[last:at])
+        pieces.append(text)
+        last = at
+    pieces.append(content[last:])
+    content = ''.join(pieces)
+
+# Write the result out (temp file + rename, so a crash cannot corrupt the source)
+tmp_path = file_path + '.tmp'
+with open(tmp_path, 'w', encoding='utf-8') as f:
     f.write(content)
+os.replace(tmp_path, file_path)
 
-print("\n✅ Successfully modified chat.js to add auto-todo creation!")
+print(f"\n{OK} Successfully modified chat.js to add auto-todo creation!")
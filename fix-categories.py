@@ -1,12 +1,25 @@
 # Fix Story categories in test file
-with open('run-mongodb-integration-tests.mjs', 'r') as f:
+import os
+import re
+import sys
+
+OK = "[ok]" if sys.platform == "win32" else "✅"
+
+CATEGORY_MAP = {'romance': 'Contemporary', 'drama': 'Billionaire'}
+CATEGORY_RE = re.compile(r"category: '(romance|drama)'")
+
+file_path = 'run-mongodb-integration-tests.mjs'
+
+with open(file_path, 'r') as f:
     content = f.read()
 
-# Replace all invalid category values
-content = content.replace("category: 'romance'", "category: 'Contemporary'")
-content = content.replace("category: 'drama'", "category: 'Billionaire'")
+# Replace all invalid category values in one walk instead of two
+content = CATEGORY_RE.sub(
+    lambda m: "category: '" + CATEGORY_MAP[m.group(1)] + "'", content)
 
-with open('run-mongodb-integration-tests.mjs', 'w') as f:
+tmp_path = file_path + '.tmp'
+with open(tmp_path, 'w') as f:
     f.write(content)
+os.replace(tmp_path, file_path)
 
-print("✅ Fixed all category values")
+print(f"{OK} Fixed all category values")
@@ -1,45 +1,48 @@
 #!/usr/bin/env python3
+import mmap
+import os
 import re
 
-# Read the file
-with open('frontend/src/pages/StrategicDashboard.jsx', 'r', encoding='utf-8') as f:
-    content = f.read()
+FILE_PATH = 'frontend/src/pages/StrategicDashboard.jsx'
 
 # Rename the competitor keyword monitoring components (only the ones I added starting around line 1999)
-replacements = [
-    # Component declarations (my new components only)
-    (r'(1999:)(const CompetitorCard = styled\.div`)', r'\1const CompetitorKeywordCard = styled.div`'),
-    (r'(2012:)(const CompetitorCardHeader = styled\.div`)', r'\1const CompetitorKeywordCardHeader = styled.div`'),
-    (r'(2019:)(const CompetitorName = styled\.h4`)', r'\1const CompetitorKeywordName = styled.h4`'),
-    (r'(2025:)(const CompetitorBadge = styled\.span`)', r'\1const CompetitorKeywordBadge = styled.span`'),
-    (r'(2038:)(const CompetitorMetric = styled\.div`)', r'\1const CompetitorKeywordMetric = styled.div`'),
-    (r'(2049:)(const CompetitorMetricLabel = styled\.span`)', r'\1const CompetitorKeywordMetricLabel = styled.span`'),
-    (r'(2054:)(const CompetitorMetricValue = styled\.span`)', r'\1const CompetitorKeywordMetricValue = styled.span`'),
-]
+RENAME = {
+    b'CompetitorCard': b'CompetitorKeywordCard',
+    b'CompetitorCardHeader': b'CompetitorKeywordCardHeader',
+    b'CompetitorName': b'CompetitorKeywordName',
+    b'CompetitorBadge': b'CompetitorKeywordBadge',
+    b'CompetitorMetric': b'CompetitorKeywordMetric',
+    b'CompetitorMetricLabel': b'CompetitorKeywordMetricLabel',
+    b'CompetitorMetricValue': b'CompetitorKeywordMetricValue',
+}
 
-# Apply replacements
-content_new = content
-for pattern, replacement in replacements:
-    content_new = re.sub(pattern, replacement, content_new, flags=re.MULTILINE)
+# Only the JSX tags are rewritten in a single pass (attributes after the tag
+# name are left untouched). The declarations are deliberately not renamed:
+# the dashboard also has older, unrelated const CompetitorCard/CompetitorName
+# components around line 1333, and a name-anchored pattern cannot tell those
+# apart from the ones added at line 1999
+RENAME_RE = re.compile(
+    rb'(</?)'
+    rb'(CompetitorCard|CompetitorCardHeader|CompetitorName|CompetitorBadge|'
+    rb'CompetitorMetric|CompetitorMetricLabel|CompetitorMetricValue)\b'
+)
 
-# Also replace in JSX usage
-content_new = re.sub(r'<CompetitorCard([^>]*key={index}', '<CompetitorKeywordCard\1', content_new)
-content_new = re.sub(r'</CompetitorCard>', '</CompetitorKeywordCard>', content_new)
-content_new = re.sub(r'<CompetitorCardHeader>', '<CompetitorKeywordCardHeader>', content_new)
-content_new = re.sub(r'</CompetitorCardHeader>', '</CompetitorKeywordCardHeader>', content_new)
-content_new = re.sub(r'<CompetitorName>', '<CompetitorKeywordName>', content_new)
-content_new = re.sub(r'</CompetitorName>', '</CompetitorKeywordName>', content_new)
-content_new = re.sub(r'<CompetitorBadge([^>]*>)', '<CompetitorKeywordBadge\1', content_new)
-content_new = re.sub(r'</CompetitorBadge>', '</CompetitorKeywordBadge>', content_new)
-content_new = re.sub(r'<CompetitorMetric>', '<CompetitorKeywordMetric>', content_new)
-content_new = re.sub(r'</CompetitorMetric>', '</CompetitorKeywordMetric>', content_new)
-content_new = re.sub(r'<CompetitorMetricLabel([^>]*)>', '<CompetitorKeywordMetricLabel\1>', content_new)
-content_new = re.sub(r'</CompetitorMetricLabel>', '</CompetitorKeywordMetricLabel>', content_new)
-content_new = re.sub(r'<CompetitorMetricValue([^>]*)>', '<CompetitorKeywordMetricValue\1>', content_new)
-content_new = re.sub(r'</CompetitorMetricValue>', '</CompetitorKeywordMetricValue>', content_new)
+# Stream the rewrite: scan the read-only mmap once and write out
+# unchanged-span + renamed-name chunks as they are found, so the new file is
+# never held in memory as one giant string
+fd = os.open(FILE_PATH, os.O_RDONLY)
+tmp_path = FILE_PATH + '.tmp'
+with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+    with open(tmp_path, 'wb', buffering=1 << 20) as out:
+        last = 0
+        for m in RENAME_RE.finditer(mm):
+            out.write(mm[last:m.start()])
+            out.write(m.group(1))
+            out.write(RENAME[m.group(2)])
+            last = m.end()
+        out.write(mm[last:])
+os.close(fd)
 
-# Write back
-with open('frontend/src/pages/StrategicDashboard.jsx', 'w', encoding='utf-8') as f:
-    f.write(content_new)
+os.replace(tmp_path, FILE_PATH)
 
 print("Components renamed successfully!")